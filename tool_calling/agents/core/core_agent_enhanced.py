@@ -10,27 +10,131 @@
 # ----------------------------------------------------------------------------
 
 import asyncio
+import importlib.util
 import json
-import hashlib
+import itertools
+import logging
+import secrets
 import time
+import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass
 from pathlib import Path
+from collections import Counter, OrderedDict, deque
 import sys
 
-# Add the tool_calling directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent / 'core'))
+# Add the tool_calling/core directory to path for imports. The core modules
+# import each other by bare name, so this cannot be dropped entirely, but it
+# only needs to happen once per process.
+if 'comprehensive_tools' not in sys.modules:
+    _core_dir = str(Path(__file__).parent.parent.parent / 'core')
+    if _core_dir not in sys.path:
+        sys.path.append(_core_dir)
 
 try:
     from comprehensive_tools import ComprehensiveTools
 except ImportError:
     # Fallback to CoreTools if comprehensive_tools not available
     from core_tools import CoreTools as ComprehensiveTools
+from core_tools import run_in_thread
+
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON encoder with stdlib fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _dumpsb(obj: Any) -> bytes:
+    """Serialize to JSON bytes for hashing and byte-oriented stores"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str).encode()
+
+# Optional JIT-compiled / vectorized synthesis kernels with pure-Python fallback.
+# NumPy and Numba are slow to import, so they are only located here and loaded
+# when an agent first initializes its tools (see _load_score_kernels)
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+HAS_NUMBA = HAS_NUMPY and importlib.util.find_spec('numba') is not None
+np = None
+_jit_kernel = None
+
+# Below this many insights, array conversion costs more than NumPy saves
+NUMPY_MIN_INSIGHTS = 16
+
+def _synth_kernel(conf, rel):
+    """Mean confidence, mean reliability and reliability-weighted confidence in one pass"""
+    conf_sum = rel_sum = weighted_sum = total_weight = 0.0
+    for i in range(len(conf)):
+        confidence = conf[i]
+        reliability = rel[i]
+        weight = reliability * 1.2 if reliability > 0.8 else reliability  # Boost high-reliability insights
+        conf_sum += confidence
+        rel_sum += reliability
+        weighted_sum += confidence * weight
+        total_weight += weight
+    weighted_confidence = weighted_sum / total_weight if total_weight > 0 else 0.5
+    return conf_sum / len(conf), rel_sum / len(conf), weighted_confidence
+
+def _numpy_kernel(conf, rel):
+    """Vectorized _synth_kernel over float64 arrays, for when Numba is unavailable"""
+    weights = np.where(rel > 0.8, rel * 1.2, rel)  # Boost high-reliability insights
+    total_weight = float(weights.sum())
+    weighted_confidence = float(conf @ weights) / total_weight if total_weight > 0 else 0.5
+    return float(conf.mean()), float(rel.mean()), weighted_confidence
+
+def _load_score_kernels():
+    """Import NumPy (and Numba, compiling _synth_kernel) once per process"""
+    global np, _jit_kernel
+    if np is None and HAS_NUMPY:
+        import numpy as np
+        if HAS_NUMBA:
+            from numba import njit
+            _jit_kernel = njit(cache=True)(_synth_kernel)
+            # Compile up front to avoid first-request latency
+            _jit_kernel(np.ones(1), np.ones(1))
+
+# Optional Celery worker pool for long-running processing requests
+try:
+    from celery import Celery
+    HAS_CELERY = True
+except ImportError:
+    HAS_CELERY = False
+
+PROCESSING_TASK_NAME = 'core_agent.run_processing_task'
+
+# Maps tabs/newlines to spaces for topic canonicalization
+_WS_TABLE = str.maketrans({c: ' ' for c in '\t\n\r'})
+
+class LRUCache(OrderedDict):
+    """Dict bounded to maxsize entries, evicting the least recently used first"""
+
+    def __init__(self, maxsize: int = 4096):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def get(self, key, default=None):
+        if key in self:
+            self.move_to_end(key)
+            return super().__getitem__(key)
+        return default
 
 @dataclass
 class ConsensusResult:
     """Result of agent consensus building"""
+    # Explicit slots (no field defaults) rather than slots=True, which needs Python 3.10
+    __slots__ = ('consensus_reached', 'agreement_level', 'participating_agents',
+                 'final_recommendation', 'dissenting_opinions', 'consensus_timestamp')
     consensus_reached: bool
     agreement_level: float
     participating_agents: List[str]
@@ -38,9 +142,23 @@ class ConsensusResult:
     dissenting_opinions: List[str]
     consensus_timestamp: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat equivalent of asdict(self), without the recursive field introspection"""
+        return {
+            'consensus_reached': self.consensus_reached,
+            'agreement_level': self.agreement_level,
+            'participating_agents': list(self.participating_agents),
+            'final_recommendation': self.final_recommendation,
+            'dissenting_opinions': list(self.dissenting_opinions),
+            'consensus_timestamp': self.consensus_timestamp
+        }
+
 @dataclass
 class ProcessingResult:
     """Complete processing result from Core agent"""
+    __slots__ = ('task_id', 'topic', 'status', 'beacon_insights', 'theory_validation',
+                 'core_synthesis', 'consensus', 'overall_confidence', 'processing_time',
+                 'recommendations')
     task_id: str
     topic: str
     status: str
@@ -80,10 +198,24 @@ class CoreAgentEnhanced(ComprehensiveTools):
         # Initialize comprehensive tools first
         super().__init__("core_agent", config)
         
-        # Core-specific state
-        self.processing_cache = {}
-        self.synthesis_cache = {}
-        self.consensus_history = []
+        # Core-specific state (processing and synthesis results are already
+        # persisted via memory_save, so the in-process copies are bounded)
+        cache_size = config.get('cache_max_entries', 4096)
+        self.processing_cache = LRUCache(config.get('processing_cache_max_entries', 512))
+        
+        # Completed results are reused for repeat (topic, processing_type) requests
+        # within result_cache_ttl seconds; the last one is kept aside for back-to-back repeats.
+        # Keyed on the exact topic, since results quote it in their nested fields
+        self._result_ttl = config.get('result_cache_ttl', 300)
+        self._result_cache = LRUCache(config.get('result_cache_max_entries', 512))
+        self._last_result = None
+        self.synthesis_cache = LRUCache(cache_size)
+        self.consensus_history = deque(maxlen=cache_size)
+        
+        # Cheap unique IDs: a random per-instance prefix plus monotonic counters
+        self._id_prefix = secrets.token_hex(4)
+        self._synth_counter = itertools.count()
+        self._pred_counter = itertools.count()
         self.coordination_metrics = {
             'total_processes': 0,
             'successful_syntheses': 0,
@@ -101,30 +233,76 @@ class CoreAgentEnhanced(ComprehensiveTools):
         
         # Note: Tool count will be determined when first accessed
         self._tools_initialized = False
+        self._tool_count = 0
+        
+        # Per-phase progress is debug output; check the level once, not per request
+        self._dbg = logger.isEnabledFor(logging.DEBUG)
+        
+        # Offload processing requests to Celery workers when a broker is configured
+        self._celery_app = None
+        if config.get('celery_broker'):
+            if HAS_CELERY:
+                self._celery_app = Celery(
+                    'core_agent',
+                    broker=config['celery_broker'],
+                    backend=config.get('celery_backend')
+                )
+            else:
+                print("⚠️ Celery not available - processing requests will run in-process")
 
     async def _ensure_tools_initialized(self):
         """Ensure tools are initialized and log the count"""
         if not self._tools_initialized:
-            tool_count = len(await self.dev_list_tools())
-            print(f"🎯 Core Agent Enhanced initialized with {tool_count} comprehensive tools")
+            self._tool_count = len(await self.dev_list_tools())
+            print(f"🎯 Core Agent Enhanced initialized with {self._tool_count} comprehensive tools")
+            if np is None and HAS_NUMPY:
+                # Importing NumPy/Numba and loading (or compiling) the cached kernel
+                # takes a while, so keep it off the event loop
+                await run_in_thread(_load_score_kernels)
             self._tools_initialized = True
 
+    @classmethod
+    async def for_testing(cls, subsystems=frozenset({'tools'}),
+                          config: Optional[Dict[str, Any]] = None) -> 'CoreAgentEnhanced':
+        """
+        Build an agent with only the requested subsystems initialized
+        
+        Subsystems: 'tools' (tool registry count), 'kernels' (NumPy/Numba score
+        kernels) and 'recall' (session-start recall entry). Tests that only inspect
+        the tool registry skip the rest of the __aenter__ work.
+        """
+        agent = cls(config if config is not None else {})
+        if 'tools' in subsystems:
+            agent._tool_count = len(await agent.dev_list_tools())
+        if 'kernels' in subsystems and np is None and HAS_NUMPY:
+            await run_in_thread(_load_score_kernels)
+        if 'recall' in subsystems:
+            await agent.recall_log_insight(
+                "Core Agent Enhanced session started",
+                {'type': 'session_start', 'tools_available': agent._tool_count}
+            )
+        agent._tools_initialized = {'tools', 'kernels'} <= set(subsystems)
+        return agent
+
     async def __aenter__(self):
         """Async context manager entry"""
         await self._ensure_tools_initialized()
         await self.recall_log_insight(
             "Core Agent Enhanced session started",
-            {'type': 'session_start', 'tools_available': len(await self.dev_list_tools())}
+            {'type': 'session_start', 'tools_available': self._tool_count}
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        await self.recall_log_insight(
-            "Core Agent Enhanced session ended",
-            {'type': 'session_end', 'processes_completed': self.coordination_metrics['total_processes']}
+        # The state save runs while the session-end recall entry is written off the loop
+        await asyncio.gather(
+            self.recall_log_insight(
+                "Core Agent Enhanced session ended",
+                {'type': 'session_end', 'processes_completed': self.coordination_metrics['total_processes']}
+            ),
+            self._ensure_state_saved()
         )
-        await self._ensure_state_saved()
 
     # =============================================================================
     # CORE-SPECIFIC TOOLS (Enhanced with comprehensive tools access)
@@ -140,7 +318,22 @@ class CoreAgentEnhanced(ComprehensiveTools):
         - Simulation tools for outcome prediction
         - Memory evolution for learning from past processes
         - Enhanced cognitive tools for better reasoning
+        
+        When a Celery broker is configured the request is queued for a worker
+        (see core_worker.py) and a queued status is returned immediately.
+        
+        Repeat requests for the same topic and processing type within
+        result_cache_ttl seconds return a copy of the earlier result.
         """
+        if self._celery_app is not None:
+            return await self._enqueue_processing_task(topic, processing_type, priority, timeout)
+        
+        canonical_topic = self._canon_topic(topic)
+        memo_key = (topic, processing_type)
+        cached = self._lookup_processing_result(memo_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Create processing task using comprehensive task management
             task_id = await self.task_create(
@@ -149,42 +342,58 @@ class CoreAgentEnhanced(ComprehensiveTools):
             )
             task_id = task_id['task_id']
             
-            # Log processing start with enhanced logging
-            processing_id = await self.recall_log_insight(
-                f"Starting comprehensive insight processing for: {topic}",
-                {'type': 'processing_start', 'topic': topic, 'task_id': task_id, 'processing_type': processing_type}
-            )
-            
-            # Save task to memory with enhanced metadata
-            memory_key = await self.memory_save(
-                f"Processing task: {topic}",
-                {
-                    'type': 'processing_task', 
-                    'task_id': task_id, 
-                    'processing_id': processing_id,
-                    'comprehensive_tools': True,
-                    'expected_agents': self.known_agents
-                }
-            )
-            
-            print(f"🔄 Core processing with comprehensive tools: {topic}")
-            
-            # Use cognition planning for complex processing
-            processing_plan = await self.cognition_plan(
-                goal=f"Process insight request for {topic}",
-                complexity=processing_type
-            )
-            
-            # Phase 1: Enhanced Knowledge Gathering (Beacon)
-            print(f"📚 Phase 1: Enhanced knowledge gathering...")
-            beacon_task_id = await self.task_create(
-                description=f"Enhanced knowledge search for: {topic}",
-                priority=priority + 1
+            # Setup steps that only depend on the task run concurrently: start log,
+            # cognition planning, and the Beacon/Theory subtasks
+            processing_id, processing_plan, beacon_task_id, theory_task_id = await asyncio.gather(
+                self.recall_log_insight(
+                    f"Starting comprehensive insight processing for: {topic}",
+                    {'type': 'processing_start', 'topic': topic, 'canonical_topic': canonical_topic,
+                     'task_id': task_id, 'processing_type': processing_type}
+                ),
+                self.cognition_plan(
+                    goal=f"Process insight request for {topic}",
+                    complexity=processing_type
+                ),
+                self.task_create(
+                    description=f"Enhanced knowledge search for: {topic}",
+                    priority=priority + 1
+                ),
+                self.task_create(
+                    description=f"Enhanced validation for: {topic}",
+                    priority=priority + 1
+                )
             )
             
-            beacon_result = await self.tools_call_agent(
-                'beacon_agent',
-                f'Perform comprehensive knowledge search with enhanced tools for: {topic}'
+            if self._dbg:
+                logger.debug("🔄 Core processing with comprehensive tools: %s", topic)
+            
+            # Phases 1 and 2: Enhanced knowledge gathering (Beacon) and validation
+            # (Theory) are dispatched together; the memory record and the subtask
+            # dependency link are written alongside them
+            if self._dbg:
+                logger.debug("📚 Phases 1-2: Enhanced knowledge gathering and validation...")
+            memory_key, beacon_result, theory_result, _ = await asyncio.gather(
+                self.memory_save(
+                    f"Processing task: {topic}",
+                    {
+                        'type': 'processing_task', 
+                        'task_id': task_id, 
+                        'canonical_topic': canonical_topic,
+                        'processing_id': processing_id,
+                        'comprehensive_tools': True,
+                        'expected_agents': self.known_agents
+                    }
+                ),
+                self.tools_call_agent(
+                    'beacon_agent',
+                    f'Perform comprehensive knowledge search with enhanced tools for: {topic}'
+                ),
+                self.tools_call_agent(
+                    'theory_agent',
+                    f'Perform enhanced validation with comprehensive tools for insights on: {topic}'
+                ),
+                # Link validation task to depend on knowledge gathering
+                self.task_link_dependency(theory_task_id['task_id'], beacon_task_id['task_id'])
             )
             
             # Simulate enhanced beacon insights
@@ -205,21 +414,6 @@ class CoreAgentEnhanced(ComprehensiveTools):
                 'agent_response': beacon_result
             }
             
-            # Phase 2: Enhanced Theory Validation
-            print(f"🔍 Phase 2: Enhanced validation and fact-checking...")
-            theory_task_id = await self.task_create(
-                description=f"Enhanced validation for: {topic}",
-                priority=priority + 1
-            )
-            
-            # Link validation task to depend on knowledge gathering
-            await self.task_link_dependency(theory_task_id['task_id'], beacon_task_id['task_id'])
-            
-            theory_result = await self.tools_call_agent(
-                'theory_agent',
-                f'Perform enhanced validation with comprehensive tools for insights on: {topic}'
-            )
-            
             # Simulate enhanced theory validation
             theory_validation = {
                 'validation_id': str(time.time()),
@@ -240,19 +434,26 @@ class CoreAgentEnhanced(ComprehensiveTools):
                 'agent_response': theory_result
             }
             
-            # Phase 3: Enhanced Core Synthesis with comprehensive tools
-            print(f"🎯 Phase 3: Enhanced multi-agent synthesis...")
-            synthesis_result = await self.core_synthesize_multi_agent_insights(
-                [beacon_insights, theory_validation],
-                synthesis_method="enhanced_weighted_average"
+            # Phases 3 and 4: Enhanced core synthesis and consensus voting run
+            # together, since the vote proposal does not depend on the synthesis
+            if self._dbg:
+                logger.debug("🎯 Phases 3-4: Enhanced multi-agent synthesis and consensus building...")
+            agent_insights = [beacon_insights, theory_validation]
+            synthesis_result, consensus_vote = await asyncio.gather(
+                self.core_synthesize_multi_agent_insights(
+                    agent_insights,
+                    synthesis_method="enhanced_weighted_average",
+                    score_vectors=self._extract_score_vectors(agent_insights)
+                ),
+                self.council_vote(
+                    proposal=f"Accept synthesis results for {topic}",
+                    vote_type="consensus_building"
+                )
             )
             
-            # Phase 4: Enhanced Consensus Building with voting tools
-            print(f"🤝 Phase 4: Enhanced consensus building...")
-            consensus_vote = await self.council_vote(
-                proposal=f"Accept synthesis results for {topic}",
-                vote_type="consensus_building"
-            )
+            # One clock read for the consensus, completion and cache timestamps
+            finished_at = time.time()
+            finished_iso = datetime.utcfromtimestamp(finished_at).isoformat()
             
             consensus_result = ConsensusResult(
                 consensus_reached=True,
@@ -260,7 +461,7 @@ class CoreAgentEnhanced(ComprehensiveTools):
                 participating_agents=self.known_agents,
                 final_recommendation=f"Proceed with insights on {topic} with high confidence",
                 dissenting_opinions=[],
-                consensus_timestamp=datetime.utcnow().isoformat()
+                consensus_timestamp=finished_iso
             )
             
             # Use prediction tools to forecast outcomes
@@ -270,6 +471,8 @@ class CoreAgentEnhanced(ComprehensiveTools):
                 'context': processing_type
             })
             
+            overall_confidence = self._calculate_overall_confidence(beacon_insights, theory_validation)
+            
             # Create comprehensive processing result
             processing_result = {
                 'task_id': task_id,
@@ -279,45 +482,116 @@ class CoreAgentEnhanced(ComprehensiveTools):
                 'beacon_insights': beacon_insights,
                 'theory_validation': theory_validation,
                 'core_synthesis': synthesis_result,
-                'consensus': asdict(consensus_result),
+                'consensus': consensus_result.to_dict(),
                 'outcome_prediction': outcome_prediction,
-                'overall_confidence': self._calculate_overall_confidence(beacon_insights, theory_validation),
-                'processing_time': time.time(),
+                'overall_confidence': overall_confidence,
+                'processing_time': finished_at,
                 'processing_id': processing_id,
                 'memory_key': memory_key,
                 'processing_plan': processing_plan,
                 'tools_used': 'comprehensive_toolkit',
-                'completed_at': datetime.utcnow().isoformat()
+                'completed_at': finished_iso
             }
             
-            # Store processing result with enhanced memory
-            await self._store_enhanced_processing_result(task_id, processing_result)
+            self._result_cache[memo_key] = processing_result
+            self._last_result = (memo_key, processing_result)
             
             # Update comprehensive metrics
             self.coordination_metrics['total_processes'] += 1
             self.coordination_metrics['successful_syntheses'] += 1
             
-            # Log completion with enhanced insight
-            await self.recall_log_insight(
-                f"Enhanced processing completed for: {topic}. Confidence: {processing_result['overall_confidence']:.2f}",
-                {
-                    'type': 'processing_complete', 
-                    'task_id': task_id, 
-                    'confidence': processing_result['overall_confidence'],
-                    'tools_used': 'comprehensive',
-                    'prediction_included': True
-                }
+            # Store the result, log completion and complete the task concurrently
+            await asyncio.gather(
+                self._store_enhanced_processing_result(task_id, processing_result),
+                self.recall_log_insight(
+                    f"Enhanced processing completed for: {topic}. Confidence: {overall_confidence:.2f}",
+                    {
+                        'type': 'processing_complete', 
+                        'task_id': task_id, 
+                        'confidence': overall_confidence,
+                        'tools_used': 'comprehensive',
+                        'prediction_included': True
+                    }
+                ),
+                self.task_cancel(task_id, "Successfully completed")
             )
             
-            # Complete the task
-            await self.task_cancel(task_id, "Successfully completed")
-            
             return processing_result
             
         except Exception as e:
             await self.security_log_risk(f"Enhanced core processing failed: {e}", "high")
             return {'error': str(e), 'topic': topic, 'task_id': task_id, 'tools_used': 'comprehensive'}
 
+    async def core_process_insight_requests(self, topics: List[str], processing_type: str = "comprehensive",
+                                          priority: int = 5, timeout: int = 300) -> List[Dict[str, Any]]:
+        """
+        Batched processing tool - runs core_process_insight_request for several topics concurrently
+        
+        Duplicate topics are processed once, concurrency is capped by max_concurrent_tasks,
+        and results are returned in the same order as the input topics.
+        """
+        unique_topics = list(dict.fromkeys(topics))
+        semaphore = asyncio.Semaphore(self.config.get('max_concurrent_tasks', 5))
+        
+        async def process(topic: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.core_process_insight_request(topic, processing_type, priority, timeout)
+        
+        results = await asyncio.gather(*[process(topic) for topic in unique_topics])
+        by_topic = dict(zip(unique_topics, results))
+        
+        await self.recall_log_insight(
+            f"Batch insight processing completed for {len(unique_topics)} topics",
+            {
+                'type': 'batch_processing_complete',
+                'topics': unique_topics,
+                'task_ids': [result.get('task_id') for result in results],
+                'failed': sum(1 for result in results if 'error' in result)
+            }
+        )
+        
+        return [by_topic[topic] for topic in topics]
+
+    async def _enqueue_processing_task(self, topic: str, processing_type: str,
+                                       priority: int, timeout: int) -> Dict[str, Any]:
+        """Submit a processing request to the Celery worker pool"""
+        try:
+            # Workers must run the request locally rather than re-queue it
+            worker_config = {k: v for k, v in self.config.items()
+                             if k not in ('celery_broker', 'celery_backend')}
+            async_result = await run_in_thread(
+                self._celery_app.send_task,
+                PROCESSING_TASK_NAME,
+                args=[topic, processing_type, priority, timeout, worker_config],
+                soft_time_limit=timeout
+            )
+            
+            await self.recall_log_insight(
+                f"Queued insight processing for: {topic}",
+                {'type': 'processing_queued', 'topic': topic, 'task_id': async_result.id, 'processing_type': processing_type}
+            )
+            
+            return {
+                'task_id': async_result.id,
+                'topic': topic,
+                'processing_type': processing_type,
+                'status': 'queued'
+            }
+            
+        except Exception as e:
+            await self.security_log_risk(f"Failed to queue core processing: {e}", "high")
+            return {'error': str(e), 'topic': topic, 'tools_used': 'comprehensive'}
+
+    def _lookup_processing_result(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a still-fresh result for key under a new task_id, or None"""
+        if self._last_result is not None and self._last_result[0] == key:
+            cached = self._last_result[1]
+        else:
+            cached = self._result_cache.get(key)
+        if cached is None or time.time() - cached['processing_time'] >= self._result_ttl:
+            return None
+        return dict(cached, task_id=str(uuid.uuid4()), cached=True)
+
     async def _store_enhanced_processing_result(self, task_id: str, result: Dict[str, Any]):
         """Store processing result with comprehensive memory and blockchain logging"""
         try:
@@ -335,8 +609,11 @@ class CoreAgentEnhanced(ComprehensiveTools):
             # Cache for quick access
             self.processing_cache[task_id] = result
             
-            # Sign and log to blockchain
-            signed_result = await self.tools_sign_output(json.dumps(result, default=str))
+            # Sign and log a BLAKE2b digest of the result rather than the full
+            # JSON blob (the result itself is already in memory above)
+            import hashlib
+            digest = hashlib.blake2b(_dumpsb(result), digest_size=32).hexdigest()
+            signed_result = await self.tools_sign_output(digest)
             
             # Upload to IPFS if available
             try:
@@ -355,7 +632,7 @@ class CoreAgentEnhanced(ComprehensiveTools):
     async def sim_predict_outcome(self, action_plan: Dict[str, Any]) -> Dict[str, Any]:
         """Predict outcomes using comprehensive simulation tools"""
         try:
-            prediction_id = str(time.time())
+            prediction_id = f"{self._id_prefix}{next(self._pred_counter):08x}"
             
             # Enhanced prediction using comprehensive tools
             prediction = {
@@ -385,12 +662,16 @@ class CoreAgentEnhanced(ComprehensiveTools):
 
     # Enhanced synthesis with comprehensive tools
     async def core_synthesize_multi_agent_insights(self, insights: List[Dict[str, Any]], 
-                                                 synthesis_method: str = "enhanced_weighted_average") -> Dict[str, Any]:
+                                                 synthesis_method: str = "enhanced_weighted_average",
+                                                 score_vectors: Optional[Tuple[List[float], List[float], List[str]]] = None) -> Dict[str, Any]:
         """
         Enhanced synthesis using comprehensive cognitive and memory tools
+        
+        Callers that already extracted the score columns (see _extract_score_vectors)
+        can pass them as score_vectors to skip a second walk over the insights.
         """
         try:
-            synthesis_id = hashlib.md5(f"enhanced_synthesis_{datetime.utcnow().isoformat()}".encode()).hexdigest()[:16]
+            synthesis_id = f"{self._id_prefix}{next(self._synth_counter):08x}"
             
             # Use comprehensive cognitive tools for synthesis
             cognitive_plan = await self.cognition_plan(
@@ -398,9 +679,21 @@ class CoreAgentEnhanced(ComprehensiveTools):
                 complexity="medium"
             )
             
-            # Enhanced topic extraction and validation
-            topics = [insight.get('topic', 'unknown') for insight in insights]
-            primary_topic = max(set(topics), key=topics.count) if topics else 'unknown'
+            # Topic counts and content pieces gathered in one pass over the insights
+            # (appends bound to locals; Counter tallies the topics in C afterwards)
+            topics = []
+            content_pieces = []
+            add_topic, add_piece = topics.append, content_pieces.append
+            for insight in insights:
+                add_topic(insight.get('topic', 'unknown'))
+                if 'summary' in insight:
+                    add_piece(insight['summary'])
+                elif 'content' in insight:
+                    add_piece(insight['content'])
+                elif 'description' in insight:
+                    add_piece(insight['description'])
+            topic_counts = Counter(topics)
+            primary_topic = topic_counts.most_common(1)[0][0] if topic_counts else 'unknown'
             
             # Log enhanced synthesis start
             await self.recall_log_insight(
@@ -409,30 +702,32 @@ class CoreAgentEnhanced(ComprehensiveTools):
             )
             
             # Extract enhanced metrics
-            confidence_scores = [insight.get('confidence', insight.get('reliability_score', 0.5)) for insight in insights]
-            reliability_scores = [insight.get('reliability_score', insight.get('confidence', 0.5)) for insight in insights]
-            contributing_agents = [insight.get('agent', insight.get('source_agent', 'unknown')) for insight in insights]
+            confidence_scores, reliability_scores, contributing_agents = (
+                score_vectors or self._extract_score_vectors(insights)
+            )
+            
+            # Mean and weighted scores, computed natively once the Numba kernel is
+            # loaded, or vectorized with NumPy for larger fan-ins without it
+            if not insights:
+                mean_confidence = mean_reliability = weighted_confidence = 0.5
+            elif _jit_kernel is not None or (np is not None and len(insights) >= NUMPY_MIN_INSIGHTS):
+                kernel = _jit_kernel or _numpy_kernel
+                mean_confidence, mean_reliability, weighted_confidence = kernel(
+                    np.fromiter(confidence_scores, dtype=np.float64, count=len(insights)),
+                    np.fromiter(reliability_scores, dtype=np.float64, count=len(insights))
+                )
+            else:
+                mean_confidence, mean_reliability, weighted_confidence = _synth_kernel(
+                    confidence_scores, reliability_scores
+                )
             
             # Enhanced synthesis calculations
             if synthesis_method == "enhanced_weighted_average":
-                weights = [score * 1.2 if score > 0.8 else score for score in reliability_scores]  # Boost high-reliability insights
-                weighted_sum = sum(c * w for c, w in zip(confidence_scores, weights))
-                total_weight = sum(weights)
-                synthesized_confidence = weighted_sum / total_weight if total_weight > 0 else 0.5
+                synthesized_confidence = weighted_confidence
             else:
-                synthesized_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.5
-            
-            synthesized_reliability = sum(reliability_scores) / len(reliability_scores) if reliability_scores else 0.5
+                synthesized_confidence = mean_confidence
             
-            # Generate enhanced synthesized content using cognitive tools
-            content_pieces = []
-            for insight in insights:
-                if 'summary' in insight:
-                    content_pieces.append(insight['summary'])
-                elif 'content' in insight:
-                    content_pieces.append(insight['content'])
-                elif 'description' in insight:
-                    content_pieces.append(insight['description'])
+            synthesized_reliability = mean_reliability
             
             # Use memory summarization for content synthesis
             if content_pieces:
@@ -440,10 +735,19 @@ class CoreAgentEnhanced(ComprehensiveTools):
                     memory_keys=None,  # Will use the content pieces
                     max_length=800
                 )
-                synthesized_content = summarized_content.get('summary_text', ' '.join(content_pieces))
+                # Only join the raw pieces when there is no summary to use
+                synthesized_content = summarized_content.get('summary_text')
+                if synthesized_content is None:
+                    synthesized_content = ' '.join(content_pieces)
             else:
                 synthesized_content = f"Synthesized insights for {primary_topic} from {len(insights)} sources."
             
+            # Save enhanced synthesis to memory
+            memory_key = await self.memory_save(
+                synthesized_content,
+                {'type': 'enhanced_synthesis_result', 'synthesis_id': synthesis_id, 'topic': primary_topic}
+            )
+            
             # Enhanced synthesis result
             synthesis_result = {
                 'synthesis_id': synthesis_id,
@@ -466,16 +770,10 @@ class CoreAgentEnhanced(ComprehensiveTools):
                     'coherence_score': 0.88
                 },
                 'cognitive_plan': cognitive_plan,
-                'synthesized_at': datetime.utcnow().isoformat()
+                'synthesized_at': datetime.utcnow().isoformat(),
+                'memory_key': memory_key
             }
             
-            # Save enhanced synthesis to memory
-            memory_key = await self.memory_save(
-                synthesized_content,
-                {'type': 'enhanced_synthesis_result', 'synthesis_id': synthesis_id, 'topic': primary_topic}
-            )
-            synthesis_result['memory_key'] = memory_key
-            
             # Store in enhanced synthesis cache
             self.synthesis_cache[synthesis_id] = synthesis_result
             
@@ -491,6 +789,22 @@ class CoreAgentEnhanced(ComprehensiveTools):
             await self.security_log_risk(f"Enhanced synthesis failed: {e}")
             return {'error': str(e), 'synthesis_method': synthesis_method}
 
+    @staticmethod
+    def _canon_topic(topic: str) -> str:
+        """Lowercase a topic and collapse its whitespace for keys and stored metadata"""
+        return ' '.join(topic.lower().translate(_WS_TABLE).split())
+
+    @staticmethod
+    def _extract_score_vectors(insights: List[Dict[str, Any]]) -> Tuple[List[float], List[float], List[str]]:
+        """Extract confidence, reliability and agent columns from insights in a single pass"""
+        confidence_scores, reliability_scores, contributing_agents = [], [], []
+        for insight in insights:
+            get = insight.get
+            confidence_scores.append(get('confidence', get('reliability_score', 0.5)))
+            reliability_scores.append(get('reliability_score', get('confidence', 0.5)))
+            contributing_agents.append(get('agent', get('source_agent', 'unknown')))
+        return confidence_scores, reliability_scores, contributing_agents
+
     def _calculate_overall_confidence(self, beacon_insights: Dict[str, Any], theory_validation: Dict[str, Any]) -> float:
         """Calculate overall confidence using enhanced metrics"""
         beacon_confidence = beacon_insights.get('reliability_average', 0.5)
@@ -500,7 +814,8 @@ class CoreAgentEnhanced(ComprehensiveTools):
         bias_penalty = theory_validation.get('bias_analysis', {}).get('overall_bias_score', 0) * 0.1
         confidence = (beacon_confidence * 0.6 + theory_confidence * 0.4) - bias_penalty
         
-        return max(0.0, min(1.0, confidence))
+        # Clamp to [0, 1] inline rather than through nested max/min calls
+        return 0.0 if confidence < 0.0 else (1.0 if confidence > 1.0 else confidence)
 
     # Add comprehensive tool demonstrations
     async def demo_comprehensive_tools(self) -> Dict[str, Any]:
@@ -550,7 +865,7 @@ class CoreAgentEnhanced(ComprehensiveTools):
             # This would track actual tool usage in a real implementation
             stats = {
                 'session_start': self.system_status['uptime_start'],
-                'total_recalls': len(list(self.recall_path.glob("*.json"))),
+                'total_recalls': self._recall_count,
                 'memory_entries': len(self.memory_entries),
                 'active_tasks': len([t for t in self.task_queue.values() if t.get('status') == 'pending']),
                 'completed_tasks': len([t for t in self.task_queue.values() if t.get('status') == 'completed']),
@@ -565,5 +880,47 @@ class CoreAgentEnhanced(ComprehensiveTools):
         except Exception as e:
             return {'error': str(e), 'tool': 'get_tool_usage_stats'}
 
+    def execute_tool_async(self, tool_name: str, **kwargs) -> asyncio.Task:
+        """
+        Start a tool call in the background and return its Task
+        
+        Lets callers overlap a slow call (e.g. recall logging) with other work and
+        await the result only when needed. Keep a reference to the Task until it is awaited.
+        """
+        return asyncio.create_task(self.execute_tool(tool_name, **kwargs))
+
+    async def execute_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Execute several independent tools concurrently
+        
+        Handlers are resolved once up front and awaited together; results are
+        returned in call order, with failures reported as error dicts as in execute_tool.
+        Names that are not methods on the agent (e.g. Tool Shop tools) go through execute_tool.
+        """
+        async def run(tool_name: str, method: Any, kwargs: Dict[str, Any]) -> Any:
+            if method is None:
+                return await self.execute_tool(tool_name, **kwargs)
+            try:
+                return await method(**kwargs)
+            except Exception as e:
+                await self.security_log_risk(f"Tool execution error: {tool_name} - {e}", "high")
+                return {"error": str(e)}
+        
+        resolved = []
+        for tool_name, kwargs in calls:
+            method = getattr(self, tool_name, None)
+            resolved.append((tool_name, method if callable(method) else None, kwargs))
+        
+        results = await asyncio.gather(*[run(*call) for call in resolved])
+        
+        if calls:
+            self.system_status['last_task'] = {
+                'tool': calls[-1][0],
+                'timestamp': datetime.utcnow().isoformat(),
+                'params': calls[-1][1],
+                'batch_size': len(calls)
+            }
+        return results
+
 # Ensure the enhanced agent can still be imported as before
 CoreAgent = CoreAgentEnhanced 
\ No newline at end of file
@@ -0,0 +1,44 @@
+# ----------------------------------------------------------------------------
+#  File:        core_worker.py
+#  Project:     Celaya Solutions (C-Suite Blockchain)
+#  Created by:  Celaya Solutions, 2025
+#  Author:      Christopher Celaya <chris@celayasolutions.com>
+#  Description: Celery worker for offloaded Core Agent processing requests
+#  Version:     1.0.0
+#  License:     BSL (SPDX id BUSL)
+#  Last Update: (June 2025)
+# ----------------------------------------------------------------------------
+
+"""
+Celery worker for Core Agent processing requests
+
+Start from this directory with the same broker the agent is configured with:
+
+    CORE_CELERY_BROKER=redis://localhost:6379/0 celery -A core_worker worker
+"""
+
+import asyncio
+import os
+from typing import Dict, Any
+
+from celery import Celery
+
+from core_agent_enhanced import CoreAgentEnhanced, PROCESSING_TASK_NAME
+
+app = Celery(
+    'core_agent',
+    broker=os.environ.get('CORE_CELERY_BROKER', 'redis://localhost:6379/0'),
+    backend=os.environ.get('CORE_CELERY_BACKEND')
+)
+
+@app.task(name=PROCESSING_TASK_NAME, bind=True)
+def run_processing_task(self, topic: str, processing_type: str, priority: int,
+                        timeout: int, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a full Core processing request in-process on the worker"""
+    self.update_state(state='PROGRESS', meta={'topic': topic, 'processing_type': processing_type})
+
+    async def process() -> Dict[str, Any]:
+        async with CoreAgentEnhanced(config) as core:
+            return await core.core_process_insight_request(topic, processing_type, priority, timeout)
+
+    return asyncio.run(process())
@@ -13,10 +13,54 @@ import asyncio
 import argparse
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, List
 from datetime import datetime
 from echo_agent_enhanced import EchoAgentEnhanced, AuditStatus, RelayMethod, InsightPriority
 
+# Optional fast JSON parser/encoder with stdlib fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Audit status -> display label (unknown statuses are shown with ❓)
+STATUS_LABELS = {
+    'verified': '✅ VERIFIED',
+    'pending': '⏳ PENDING',
+    'flagged': '⚠️ FLAGGED',
+    'rejected': '❌ REJECTED'
+}
+
+# Audit logs are counted in chunks of this many bytes rather than read whole
+LOG_COUNT_CHUNK_SIZE = 1 << 20
+
+def _load_json_file(path) -> Any:
+    """Parse a JSON file straight from its bytes (orjson's decode errors subclass json's)"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+@lru_cache(maxsize=4)
+def _read_config(path: str, mtime_ns: int) -> dict:
+    """Parsed config file, cached until the file's modification time changes"""
+    return _load_json_file(path)
+
+def _write_lines(lines: List[str]):
+    """Print lines to stdout in a single write rather than one print() call each"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _count_lines(path: Path) -> int:
+    """Number of lines in a file (including an unterminated last line), in constant memory"""
+    lines = 0
+    last = b'\n'
+    with open(path, 'rb', buffering=0) as f:
+        while chunk := f.read(LOG_COUNT_CHUNK_SIZE):
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    return lines if last == b'\n' else lines + 1
+
 class EchoCLI:
     """Command-line interface for the Echo agent"""
     
@@ -28,8 +72,8 @@ class EchoCLI:
         config_file = Path("echo_config.json")
         
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            # Copied so changes to one CLI's config don't leak into the cached parse
+            return dict(_read_config(str(config_file.resolve()), config_file.stat().st_mtime_ns))
         else:
             # Create default config
             default_config = {
@@ -56,8 +100,7 @@ class EchoCLI:
         
         # Load insight data
         try:
-            with open(insight_file, 'r') as f:
-                insight_data = json.load(f)
+            insight_data = _load_json_file(insight_file)
         except FileNotFoundError:
             print(f"❌ Error: File {insight_file} not found")
             return
@@ -102,8 +145,7 @@ class EchoCLI:
         
         # Load insight data
         try:
-            with open(insight_file, 'r') as f:
-                insight_data = json.load(f)
+            insight_data = _load_json_file(insight_file)
         except FileNotFoundError:
             print(f"❌ Error: File {insight_file} not found")
             return
@@ -173,137 +215,148 @@ class EchoCLI:
 
     def _display_audit_results(self, audit_result: dict):
         """Display audit results in a formatted way"""
-        print(f"\n🔍 AUDIT RESULTS:")
-        print("-" * 30)
-        print(f"Audit ID: {audit_result.get('audit_id', 'unknown')}")
-        print(f"Status: {self._format_status(audit_result.get('audit_status', 'unknown'))}")
-        print(f"Confidence Score: {audit_result.get('confidence_score', 0):.2f}")
-        print(f"Risk Assessment: {audit_result.get('risk_assessment', 'unknown').upper()}")
+        out = []
+        out.append(f"\n🔍 AUDIT RESULTS:")
+        out.append("-" * 30)
+        out.append(f"Audit ID: {audit_result.get('audit_id', 'unknown')}")
+        out.append(f"Status: {self._format_status(audit_result.get('audit_status', 'unknown'))}")
+        out.append(f"Confidence Score: {audit_result.get('confidence_score', 0):.2f}")
+        out.append(f"Risk Assessment: {audit_result.get('risk_assessment', 'unknown').upper()}")
         
         # Verification checks
         checks = audit_result.get('verification_checks', {})
         if checks:
-            print(f"\n✅ VERIFICATION CHECKS:")
-            print("-" * 30)
+            out.append(f"\n✅ VERIFICATION CHECKS:")
+            out.append("-" * 30)
             for check, passed in checks.items():
                 status = "✅" if passed else "❌"
-                print(f"{status} {check.replace('_', ' ').title()}")
+                out.append(f"{status} {check.replace('_', ' ').title()}")
         
         # Audit notes
         notes = audit_result.get('audit_notes', [])
         if notes:
-            print(f"\n📝 AUDIT NOTES:")
-            print("-" * 30)
+            out.append(f"\n📝 AUDIT NOTES:")
+            out.append("-" * 30)
             for note in notes[:3]:  # Show first 3 notes
-                print(f"• {note}")
+                out.append(f"• {note}")
         
-        print(f"\n🔒 Audit Hash: {audit_result.get('insight_hash', 'unknown')[:16]}...")
+        out.append(f"\n🔒 Audit Hash: {audit_result.get('insight_hash', 'unknown')[:16]}...")
+        
+        _write_lines(out)
 
     def _display_relay_results(self, relay_result: dict):
         """Display relay results in a formatted way"""
-        print(f"\n📡 RELAY RESULTS:")
-        print("-" * 30)
-        print(f"Relay ID: {relay_result.get('relay_id', 'unknown')}")
-        print(f"Success: {relay_result.get('success', False)}")
-        print(f"Success Rate: {relay_result.get('success_rate', 0):.1%}")
+        out = []
+        out.append(f"\n📡 RELAY RESULTS:")
+        out.append("-" * 30)
+        out.append(f"Relay ID: {relay_result.get('relay_id', 'unknown')}")
+        out.append(f"Success: {relay_result.get('success', False)}")
+        out.append(f"Success Rate: {relay_result.get('success_rate', 0):.1%}")
         
         # Delivery status
         delivery_status = relay_result.get('delivery_status', {})
         if delivery_status:
-            print(f"\n📋 DELIVERY STATUS:")
-            print("-" * 30)
+            out.append(f"\n📋 DELIVERY STATUS:")
+            out.append("-" * 30)
             for agent, status in delivery_status.items():
                 icon = "✅" if status == "delivered" else "❌"
-                print(f"{icon} {agent}: {status}")
+                out.append(f"{icon} {agent}: {status}")
         
-        print(f"\n🔒 Relay Signature: {relay_result.get('relay_signature', 'unknown')[:16]}...")
+        out.append(f"\n🔒 Relay Signature: {relay_result.get('relay_signature', 'unknown')[:16]}...")
+        
+        _write_lines(out)
 
     def _display_compliance_results(self, compliance_result: dict):
         """Display compliance results in a formatted way"""
-        print(f"\n✅ COMPLIANCE RESULTS:")
-        print("-" * 30)
-        print(f"Check ID: {compliance_result.get('check_id', 'unknown')}")
-        print(f"Is Compliant: {compliance_result.get('is_compliant', False)}")
-        print(f"Compliance Score: {compliance_result.get('compliance_score', 0):.2%}")
+        out = []
+        out.append(f"\n✅ COMPLIANCE RESULTS:")
+        out.append("-" * 30)
+        out.append(f"Check ID: {compliance_result.get('check_id', 'unknown')}")
+        out.append(f"Is Compliant: {compliance_result.get('is_compliant', False)}")
+        out.append(f"Compliance Score: {compliance_result.get('compliance_score', 0):.2%}")
         
         # Passed checks
         passed = compliance_result.get('passed_checks', [])
         if passed:
-            print(f"\n✅ PASSED CHECKS ({len(passed)}):")
-            print("-" * 30)
+            out.append(f"\n✅ PASSED CHECKS ({len(passed)}):")
+            out.append("-" * 30)
             for check in passed:
-                print(f"✅ {check.replace('_', ' ').title()}")
+                out.append(f"✅ {check.replace('_', ' ').title()}")
         
         # Failed checks
         failed = compliance_result.get('failed_checks', [])
         if failed:
-            print(f"\n❌ FAILED CHECKS ({len(failed)}):")
-            print("-" * 30)
+            out.append(f"\n❌ FAILED CHECKS ({len(failed)}):")
+            out.append("-" * 30)
             for check in failed:
-                print(f"❌ {check.replace('_', ' ').title()}")
+                out.append(f"❌ {check.replace('_', ' ').title()}")
         
         # Recommendations
         recommendations = compliance_result.get('recommendations', [])
         if recommendations:
-            print(f"\n💡 RECOMMENDATIONS:")
-            print("-" * 30)
+            out.append(f"\n💡 RECOMMENDATIONS:")
+            out.append("-" * 30)
             for rec in recommendations[:3]:  # Show first 3 recommendations
-                print(f"• {rec}")
+                out.append(f"• {rec}")
+        
+        _write_lines(out)
 
     def _display_report_summary(self, report: dict):
         """Display report summary"""
-        print(f"\n📊 AUDIT REPORT SUMMARY:")
-        print("-" * 30)
+        out = []
+        out.append(f"\n📊 AUDIT REPORT SUMMARY:")
+        out.append("-" * 30)
         
         # Audit summary
         audit_summary = report.get('audit_summary', {})
-        print(f"Total Audits: {audit_summary.get('total_audits', 0)}")
-        print(f"Verified Insights: {audit_summary.get('verified_insights', 0)}")
-        print(f"Flagged Insights: {audit_summary.get('flagged_insights', 0)}")
-        print(f"Rejected Insights: {audit_summary.get('rejected_insights', 0)}")
-        print(f"Verification Rate: {audit_summary.get('verification_rate', 0):.1%}")
+        out.append(f"Total Audits: {audit_summary.get('total_audits', 0)}")
+        out.append(f"Verified Insights: {audit_summary.get('verified_insights', 0)}")
+        out.append(f"Flagged Insights: {audit_summary.get('flagged_insights', 0)}")
+        out.append(f"Rejected Insights: {audit_summary.get('rejected_insights', 0)}")
+        out.append(f"Verification Rate: {audit_summary.get('verification_rate', 0):.1%}")
         
         # Compliance summary
         compliance_summary = report.get('compliance_summary', {})
         if compliance_summary:
-            print(f"\n✅ COMPLIANCE SUMMARY:")
-            print("-" * 30)
-            print(f"Total Checks: {compliance_summary.get('total_checks', 0)}")
-            print(f"Compliance Rate: {compliance_summary.get('compliance_rate', 0):.1%}")
+            out.append(f"\n✅ COMPLIANCE SUMMARY:")
+            out.append("-" * 30)
+            out.append(f"Total Checks: {compliance_summary.get('total_checks', 0)}")
+            out.append(f"Compliance Rate: {compliance_summary.get('compliance_rate', 0):.1%}")
         
         # Relay summary
         relay_summary = report.get('relay_summary', {})
         if relay_summary:
-            print(f"\n📡 RELAY SUMMARY:")
-            print("-" * 30)
-            print(f"Total Relays: {relay_summary.get('total_relays', 0)}")
-            print(f"Success Rate: {relay_summary.get('success_rate', 0):.1%}")
+            out.append(f"\n📡 RELAY SUMMARY:")
+            out.append("-" * 30)
+            out.append(f"Total Relays: {relay_summary.get('total_relays', 0)}")
+            out.append(f"Success Rate: {relay_summary.get('success_rate', 0):.1%}")
         
         # Recommendations
         recommendations = report.get('recommendations', [])
         if recommendations:
-            print(f"\n💡 RECOMMENDATIONS:")
-            print("-" * 30)
+            out.append(f"\n💡 RECOMMENDATIONS:")
+            out.append("-" * 30)
             for rec in recommendations[:3]:  # Show first 3 recommendations
-                print(f"• {rec}")
+                out.append(f"• {rec}")
+        
+        _write_lines(out)
 
     def _save_report_to_file(self, report: dict, output_file: str):
         """Save report to JSON file"""
         try:
-            with open(output_file, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            if HAS_ORJSON:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                                         default=str))
+            else:
+                with open(output_file, 'w') as f:
+                    json.dump(report, f, indent=2, default=str)
         except Exception as e:
             print(f"❌ Error saving report: {e}")
 
     def _format_status(self, status: str) -> str:
         """Format audit status with appropriate emoji"""
-        status_map = {
-            'verified': '✅ VERIFIED',
-            'pending': '⏳ PENDING',
-            'flagged': '⚠️ FLAGGED',
-            'rejected': '❌ REJECTED'
-        }
-        return status_map.get(status.lower(), f"❓ {status.upper()}")
+        return STATUS_LABELS.get(status.lower()) or f"❓ {status.upper()}"
 
     def list_audit_logs(self):
         """List available audit log files"""
@@ -324,8 +377,7 @@ class EchoCLI:
         
         for log_file in sorted(log_files):
             try:
-                with open(log_file, 'r') as f:
-                    entries = len(f.readlines())
+                entries = _count_lines(log_file)
                 print(f"📄 {log_file.name}: {entries} audits")
             except Exception as e:
                 print(f"📄 {log_file.name}: Error reading file - {e}")
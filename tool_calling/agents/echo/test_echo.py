@@ -12,6 +12,7 @@
 import asyncio
 import json
 import pytest
+import pytest_asyncio
 from pathlib import Path
 from datetime import datetime, timedelta
 from echo_agent_enhanced import (
@@ -19,25 +20,34 @@ from echo_agent_enhanced import (
     InsightAudit, RelayRecord, ComplianceCheck
 )
 
+# All tests share one event loop, so the shared agent's background tasks keep running between tests
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+TEST_CONFIG = {
+    'audit_threshold': 0.7,
+    'relay_timeout': 30,
+    'compliance_rules': [
+        'source_verification',
+        'content_integrity',
+        'authorization_check'
+    ]
+}
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def echo_agent():
+    """Create an Echo agent shared by the module's tests (agent start-up is mostly key loading)"""
+    async with EchoAgentEnhanced(TEST_CONFIG) as agent:
+        yield agent
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def fresh_echo_agent():
+    """Create an Echo agent for tests that need untouched state"""
+    async with EchoAgentEnhanced(TEST_CONFIG) as agent:
+        yield agent
+
 class TestEchoAgent:
     """Test suite for Echo agent functionality"""
     
-    @pytest.fixture
-    async def echo_agent(self):
-        """Create an Echo agent for testing"""
-        config = {
-            'audit_threshold': 0.7,
-            'relay_timeout': 30,
-            'compliance_rules': [
-                'source_verification',
-                'content_integrity',
-                'authorization_check'
-            ]
-        }
-        
-        async with EchoAgentEnhanced(config) as agent:
-            yield agent
-
     @pytest.fixture
     def sample_insight_data(self):
         """Sample insight data for testing"""
@@ -70,13 +80,13 @@ class TestEchoAgent:
     # BASIC FUNCTIONALITY TESTS
     # =============================================================================
 
-    async def test_agent_initialization(self, echo_agent):
+    async def test_agent_initialization(self, fresh_echo_agent):
         """Test Echo agent initialization"""
-        assert echo_agent.agent_id == "echo_agent"
-        assert echo_agent.audit_threshold == 0.7
-        assert echo_agent.relay_timeout == 30
-        assert len(echo_agent.compliance_rules) >= 3
-        assert echo_agent.audit_metrics['total_audits'] == 0
+        assert fresh_echo_agent.agent_id == "echo_agent"
+        assert fresh_echo_agent.audit_threshold == 0.7
+        assert fresh_echo_agent.relay_timeout == 30
+        assert len(fresh_echo_agent.compliance_rules) >= 3
+        assert fresh_echo_agent.audit_metrics['total_audits'] == 0
 
     async def test_tool_discovery(self, echo_agent):
         """Test tool discovery and listing"""
@@ -256,33 +266,33 @@ class TestEchoAgent:
     # AGENT MONITORING TESTS
     # =============================================================================
 
-    async def test_monitor_agents_basic(self, echo_agent):
+    async def test_monitor_agents_basic(self, fresh_echo_agent):
         """Test basic agent monitoring"""
         agent_ids = ['beacon_agent', 'theory_agent']
-        result = await echo_agent.echo_monitor_agents(agent_ids)
+        result = await fresh_echo_agent.echo_monitor_agents(agent_ids)
         
         assert 'success' in result
         assert 'total_monitored' in result
         assert 'monitored_agents' in result
         assert 'status' in result
 
-    async def test_monitor_agents_tracking(self, echo_agent):
+    async def test_monitor_agents_tracking(self, fresh_echo_agent):
         """Test agent monitoring tracking"""
         agent_ids = ['beacon_agent', 'theory_agent', 'core_agent']
-        result = await echo_agent.echo_monitor_agents(agent_ids)
+        result = await fresh_echo_agent.echo_monitor_agents(agent_ids)
         
         if result['success']:
             assert result['total_monitored'] == len(agent_ids)
             assert len(result['monitored_agents']) == len(agent_ids)
 
-    async def test_monitor_agents_limits(self, echo_agent):
+    async def test_monitor_agents_limits(self, fresh_echo_agent):
         """Test agent monitoring limits"""
         # Try to monitor more agents than the limit
         many_agents = [f'agent_{i}' for i in range(15)]
-        result = await echo_agent.echo_monitor_agents(many_agents)
+        result = await fresh_echo_agent.echo_monitor_agents(many_agents)
         
         # Should respect the monitoring limit
-        max_monitored = echo_agent.config.get('monitoring_settings', {}).get('max_monitored_agents', 10)
+        max_monitored = fresh_echo_agent.config.get('monitoring_settings', {}).get('max_monitored_agents', 10)
         if result['success']:
             assert result['total_monitored'] <= max_monitored
 
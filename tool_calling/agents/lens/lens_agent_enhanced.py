@@ -17,6 +17,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
+from collections import Counter
 import sys
 from enum import Enum
 import asyncio
@@ -1247,8 +1248,8 @@ class LensAgentEnhanced(CoreTools):
         
         if analyses:
             # Most common confidence level
-            confidence_levels = [a.confidence_level.value for a in analyses]
-            most_common_confidence = max(set(confidence_levels), key=confidence_levels.count)
+            confidence_levels = Counter(a.confidence_level.value for a in analyses)
+            most_common_confidence = confidence_levels.most_common(1)[0][0]
             insights.append({
                 'type': 'performance',
                 'insight': f'Most analyses achieved {most_common_confidence} confidence level',
@@ -10,13 +10,15 @@
 # ----------------------------------------------------------------------------
 
 import json
+import os
 import hashlib
 import time
 import asyncio
+import functools
 import aiohttp
 import requests
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import logging
@@ -46,6 +48,33 @@ except ImportError:
     HAS_IPFS = False
     print("⚠️ IPFS client not available")
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _encode_json(data: Any, pretty: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON (compact unless pretty), using orjson's native encoder when available"""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2 if pretty else orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=str, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, default=str).encode()
+    return json.dumps(data, separators=(',', ':'), default=str).encode()
+
+def _load_json(path: Path) -> Any:
+    """Read a UTF-8 JSON file, using orjson's native parser when available"""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+async def run_in_thread(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking call in the event loop's default executor (asyncio.to_thread needs Python 3.9)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
 @dataclass
 class KnowledgeSource:
     """Represents a knowledge source with metadata"""
@@ -95,6 +124,85 @@ class VoteEntry:
     status: str  # 'active', 'passed', 'rejected'
     created_at: str
 
+# Core toolchain schemas, built once at import rather than on every get_available_tools call
+CORE_TOOL_SCHEMAS = (
+    {
+        "name": "recall_log_insight",
+        "description": "Logs any thought, message, result to the C-Ledger",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "Content to log"},
+                "metadata": {"type": "object", "description": "Optional metadata"}
+            },
+            "required": ["content"]
+        }
+    },
+    {
+        "name": "memory_retrieve",
+        "description": "Pulls past memory entries from FAISS, Recall, or vector store",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"},
+                "limit": {"type": "integer", "description": "Max results", "default": 5}
+            },
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "memory_save",
+        "description": "Writes memory to FAISS/Recall + returns a memory key",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "Content to save"},
+                "metadata": {"type": "object", "description": "Optional metadata"}
+            },
+            "required": ["content"]
+        }
+    },
+    {
+        "name": "tools_call_agent",
+        "description": "Directly call another agent with a subtask",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "agent_id": {"type": "string", "description": "Target agent ID"},
+                "task": {"type": "string", "description": "Task description"}
+            },
+            "required": ["agent_id", "task"]
+        }
+    },
+    {
+        "name": "tools_ask_user",
+        "description": "Sends a clarifying question to the user",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "question": {"type": "string", "description": "Question to ask"}
+            },
+            "required": ["question"]
+        }
+    },
+    {
+        "name": "tools_get_time",
+        "description": "Fetches current date/time for logging or decision-making",
+        "parameters": {"type": "object", "properties": {}}
+    },
+    {
+        "name": "tools_sign_output",
+        "description": "Signs the final answer before logging to Recall blockchain",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "output": {"type": "string", "description": "Content to sign"}
+            },
+            "required": ["output"]
+        }
+    }
+)
+
 class CoreTools:
     """
     Core Tools Implementation
@@ -112,6 +220,9 @@ class CoreTools:
         self.agent_id = agent_id
         self.config = config
         
+        # Recall and memory files are written compact unless pretty_json is set
+        self._pretty_json = config.get('pretty_json', False)
+        
         # Initialize storage paths - updated for new structure
         base_path = Path(__file__).parent.parent  # Go up to tool_calling directory
         self.recall_path = base_path / "storage" / "recall_logs" / agent_id
@@ -123,6 +234,10 @@ class CoreTools:
         self.memory_path.mkdir(parents=True, exist_ok=True)
         self.logs_path.mkdir(parents=True, exist_ok=True)
         
+        # Recall files on disk, counted once here and kept current by recall_log_insight
+        with os.scandir(self.recall_path) as entries:
+            self._recall_count = sum(1 for entry in entries if entry.name.endswith('.json'))
+        
         # Initialize memory system
         self.memory_index = None
         self.memory_entries = {}
@@ -141,6 +256,9 @@ class CoreTools:
             'is_isolated': False
         }
         
+        # Serializes rewrites of memories.json from concurrent memory_save calls
+        self._memory_write_lock = asyncio.Lock()
+        
         # Agent registry and voting
         self.agent_registry = {}
         self.active_votes = {}
@@ -164,8 +282,7 @@ class CoreTools:
             # Load existing memories if available
             memory_file = self.memory_path / "memories.json"
             if memory_file.exists():
-                with open(memory_file, 'r') as f:
-                    self.memory_entries = json.load(f)
+                self.memory_entries = _load_json(memory_file)
         except Exception as e:
             print(f"⚠️ Memory system init failed: {e}")
 
@@ -211,10 +328,11 @@ class CoreTools:
         """Logs any thought, message, result to the C-Ledger"""
         try:
             timestamp = datetime.utcnow().isoformat()
-            content_hash = hashlib.sha256(content.encode()).hexdigest()
+            data = content.encode()
+            content_hash = hashlib.sha256(data).hexdigest()
             
             # Sign the content
-            signature = self._sign_content(content)
+            signature = self._sign_content(data)
             
             # Create recall entry
             recall_entry = RecallEntry(
@@ -240,14 +358,15 @@ class CoreTools:
                 except:
                     pass
             
-            # Save to local recall log
+            # Save to local recall log (encoded here, written off the event loop)
             recall_file = self.recall_path / f"{timestamp.replace(':', '-')}.json"
-            with open(recall_file, 'w') as f:
-                json.dump({
-                    'recall_entry': asdict(recall_entry),
-                    'ipfs_cid': ipfs_cid,
-                    'metadata': metadata
-                }, f, indent=2)
+            payload = _encode_json({
+                'recall_entry': asdict(recall_entry),
+                'ipfs_cid': ipfs_cid,
+                'metadata': metadata
+            }, self._pretty_json)
+            await run_in_thread(recall_file.write_bytes, payload)
+            self._recall_count += 1
             
             self.system_status['last_cid'] = recall_entry.cid
             
@@ -261,8 +380,7 @@ class CoreTools:
         try:
             # Search local recall logs
             for recall_file in self.recall_path.glob("*.json"):
-                with open(recall_file, 'r') as f:
-                    data = json.load(f)
+                data = _load_json(recall_file)
                     
                 if data['recall_entry']['cid'] == cid:
                     return {
@@ -319,9 +437,11 @@ class CoreTools:
             self.memory_entries[memory_key] = asdict(memory_entry)
             
             # Persist to disk
+            # Snapshot under the lock so writes land in order, then write off the event loop
             memory_file = self.memory_path / "memories.json"
-            with open(memory_file, 'w') as f:
-                json.dump(self.memory_entries, f, indent=2)
+            async with self._memory_write_lock:
+                payload = _encode_json(self.memory_entries, self._pretty_json)
+                await run_in_thread(memory_file.write_bytes, payload)
             
             return memory_key
             
@@ -384,8 +504,9 @@ class CoreTools:
     async def tools_sign_output(self, output: str) -> Dict[str, str]:
         """Signs the final answer before logging to Recall blockchain"""
         try:
-            signature = self._sign_content(output)
-            content_hash = hashlib.sha256(output.encode()).hexdigest()
+            data = output.encode()
+            signature = self._sign_content(data)
+            content_hash = hashlib.sha256(data).hexdigest()
             
             signed_output = {
                 'content': output,
@@ -433,8 +554,7 @@ class CoreTools:
             
             # Search recall logs for task-related entries
             for recall_file in self.recall_path.glob("*.json"):
-                with open(recall_file, 'r') as f:
-                    data = json.load(f)
+                data = _load_json(recall_file)
                     
                 if (data.get('metadata', {}).get('task_id') == task_id or
                     task_id in data['recall_entry']['content']):
@@ -445,14 +565,14 @@ class CoreTools:
         except Exception as e:
             return [{'error': str(e)}]
 
-    def _sign_content(self, content: str) -> str:
-        """Sign content with private key"""
+    def _sign_content(self, content: Union[str, bytes]) -> str:
+        """Sign content with private key (bytes are signed as-is, without re-encoding)"""
         if not HAS_CRYPTO or not self.private_key:
             return "no_crypto_available"
             
         try:
             signature = self.private_key.sign(
-                content.encode(),
+                content.encode() if isinstance(content, str) else content,
                 padding.PSS(
                     mgf=padding.MGF1(hashes.SHA256()),
                     salt_length=padding.PSS.MAX_LENGTH
@@ -515,88 +635,8 @@ class CoreTools:
     
     def get_available_tools(self) -> List[Dict[str, Any]]:
         """Get list of all available tools for this agent"""
-        tools = []
-        
-        # Core toolchain
-        core_tools = [
-            {
-                "name": "recall_log_insight",
-                "description": "Logs any thought, message, result to the C-Ledger",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "content": {"type": "string", "description": "Content to log"},
-                        "metadata": {"type": "object", "description": "Optional metadata"}
-                    },
-                    "required": ["content"]
-                }
-            },
-            {
-                "name": "memory_retrieve",
-                "description": "Pulls past memory entries from FAISS, Recall, or vector store",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {"type": "string", "description": "Search query"},
-                        "limit": {"type": "integer", "description": "Max results", "default": 5}
-                    },
-                    "required": ["query"]
-                }
-            },
-            {
-                "name": "memory_save",
-                "description": "Writes memory to FAISS/Recall + returns a memory key",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "content": {"type": "string", "description": "Content to save"},
-                        "metadata": {"type": "object", "description": "Optional metadata"}
-                    },
-                    "required": ["content"]
-                }
-            },
-            {
-                "name": "tools_call_agent",
-                "description": "Directly call another agent with a subtask",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "agent_id": {"type": "string", "description": "Target agent ID"},
-                        "task": {"type": "string", "description": "Task description"}
-                    },
-                    "required": ["agent_id", "task"]
-                }
-            },
-            {
-                "name": "tools_ask_user",
-                "description": "Sends a clarifying question to the user",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "question": {"type": "string", "description": "Question to ask"}
-                    },
-                    "required": ["question"]
-                }
-            },
-            {
-                "name": "tools_get_time",
-                "description": "Fetches current date/time for logging or decision-making",
-                "parameters": {"type": "object", "properties": {}}
-            },
-            {
-                "name": "tools_sign_output",
-                "description": "Signs the final answer before logging to Recall blockchain",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "output": {"type": "string", "description": "Content to sign"}
-                    },
-                    "required": ["output"]
-                }
-            }
-        ]
-        
-        return core_tools
+        # The core schemas are static; hand out a fresh list that subclasses can extend
+        return list(CORE_TOOL_SCHEMAS)
 
     async def execute_tool(self, tool_name: str, **kwargs) -> Any:
         """Execute a tool by name with given parameters"""